@@ -1,6 +1,12 @@
 import os
+import sys
+import json
+import hashlib
 import threading
 import time
+import queue
+import itertools
+from collections import deque
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import messagebox
@@ -31,10 +37,65 @@ TIERS = list(TIER_POINTS.keys())
 TOP_N = 10_000
 PAGE_SIZE = 50
 
-BASE_DIR = os.path.dirname(__file__)
+# background work: lower number runs first
+MAX_WORKERS = 4
+PRIO_INTERACTIVE = 0
+PRIO_REFRESH = 10
+PRIO_IDLE = 20
+
+# idle prefetch: players each side of your rank, typed-name matches, request cap
+PREFETCH_NEARBY = 5
+PREFETCH_MATCHES = 5
+PREFETCH_BUDGET = 30  # requests per minute
+PROFILE_TTL = 300
+
+def launch_elapsed():
+    """
+    seconds since the app was launched, from /proc. a Linux --onefile build runs
+    under its bootloader, so timing from the parent counts the bundle unpack.
+    None where /proc is unavailable (Windows, macOS)
+    """
+    def since_start(pid):
+        with open(f"/proc/{pid}/stat") as f:
+            ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        with open("/proc/uptime") as f:
+            up = float(f.read().split()[0])
+        return up - ticks / os.sysconf("SC_CLK_TCK")
+
+    try:
+        pid = os.getpid()
+        if getattr(sys, "frozen", False) and os.path.realpath(f"/proc/{os.getppid()}/exe") == os.path.realpath(sys.executable):
+            pid = os.getppid()
+        return since_start(pid)
+    except Exception:
+        return None
+
+LAUNCH_ELAPSED = launch_elapsed()  # time spent before main.py ran (bootloader + interpreter)
+START_T = time.perf_counter() - (LAUNCH_ELAPSED or 0.0)
+
+APP_NAME = "mctiers-rank-tool"
+DATA_VERSION = 1  # bump to start a fresh data dir
+ENTRY_SCHEMA = {"icons": 1, "cache": 1}  # bump one to invalidate just that kind
+CACHE_MAX_ENTRIES = 500  # downloaded heads kept in cache/
+CACHE_MAX_AGE = 14 * 86400  # re-download heads older than this
+
+def user_data_dir():
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, APP_NAME, f"v{DATA_VERSION}")
+
+# bundled assets are read-only (PyInstaller --onefile unpacks them to a new temp dir every run)
+BASE_DIR = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
 ASSETS = os.path.join(BASE_DIR, "assets")
-ICON_DIR = os.path.join(ASSETS, "icons")
-CACHE_DIR = os.path.join(ASSETS, "cache")
+
+DATA_DIR = user_data_dir()
+ICON_DIR = os.path.join(DATA_DIR, "icons")
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+MANIFEST_PATH = os.path.join(DATA_DIR, "manifest.json")
 os.makedirs(ICON_DIR, exist_ok=True)
 os.makedirs(CACHE_DIR, exist_ok=True)
 
@@ -85,6 +146,133 @@ def F(size=10, bold=False):
     fam = MINECRAFT_FONT_NAME if minecraft_font_available() else "Segoe UI"
     return (fam, size, "bold") if bold else (fam, size)
 
+# ============================================================
+# DATA DIR
+# ============================================================
+
+manifest_lock = threading.Lock()
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, "r", encoding="utf-8") as f:
+            m = json.load(f)
+        if m.get("version") == DATA_VERSION and isinstance(m.get("entries"), dict):
+            return m
+    except Exception:
+        pass
+    return {"version": DATA_VERSION, "entries": {}}
+
+manifest = load_manifest()
+
+def save_manifest():
+    tmp = MANIFEST_PATH + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp, MANIFEST_PATH)
+
+def file_digest(path: str):
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def record_entry(path: str, source="fetched", seed=None, save=True):
+    rel = os.path.relpath(path, DATA_DIR).replace(os.sep, "/")
+    kind = rel.split("/", 1)[0]
+    with manifest_lock:
+        manifest["entries"][rel] = {
+            "schema": ENTRY_SCHEMA.get(kind, 1),
+            "source": source,
+            "seed": seed,
+            "saved": int(time.time()),
+        }
+        if not save:
+            return
+        try:
+            save_manifest()
+        except Exception as e:
+            print(f"MANIFEST: {e}")
+
+def seed_data_dir():
+    """
+    copy bundled assets into the user data dir when missing or stale.
+    stale = wrong schema, or a seed copy whose bundled file has changed.
+    returns number of files copied (0 on a warm start)
+    """
+    copied = 0
+    entries = manifest["entries"]
+
+    with manifest_lock:
+        stale = [rel for rel, e in entries.items()
+                 if e.get("schema") != ENTRY_SCHEMA.get(rel.split("/", 1)[0], 1)]
+        for rel in stale:
+            try:
+                os.remove(os.path.join(DATA_DIR, rel))
+            except Exception:
+                pass
+            del entries[rel]
+        if stale:
+            save_manifest()
+
+    for kind in ENTRY_SCHEMA:
+        src_dir = os.path.join(ASSETS, kind)
+        if not os.path.isdir(src_dir):
+            continue
+        for fn in os.listdir(src_dir):
+            src = os.path.join(src_dir, fn)
+            dst = os.path.join(DATA_DIR, kind, fn)
+            if not os.path.isfile(src):
+                continue
+            e = entries.get(f"{kind}/{fn}")
+            if os.path.exists(dst) and e and e.get("source") == "fetched":
+                continue  # fetched here, newer than anything bundled
+            digest = file_digest(src)
+            if os.path.exists(dst) and e and e.get("seed") == digest:
+                continue
+            try:
+                shutil.copyfile(src, dst)
+                record_entry(dst, source="seed", seed=digest, save=False)
+                copied += 1
+            except Exception as ex:
+                print(f"SEED {kind}/{fn}: {ex}")
+
+    if copied:
+        with manifest_lock:
+            save_manifest()
+    return copied
+
+def prune_cache():
+    """
+    drop downloaded cache/ entries older than CACHE_MAX_AGE, then the oldest
+    beyond CACHE_MAX_ENTRIES. seed copies are left alone. returns number removed
+    """
+    now = time.time()
+    with manifest_lock:
+        entries = manifest["entries"]
+        fetched = sorted(
+            (rel for rel, e in entries.items()
+             if rel.startswith("cache/") and e.get("source") != "seed"),
+            key=lambda rel: entries[rel].get("saved", 0),
+            reverse=True,
+        )
+        drop = [rel for i, rel in enumerate(fetched)
+                if i >= CACHE_MAX_ENTRIES or now - entries[rel].get("saved", 0) > CACHE_MAX_AGE]
+        for rel in drop:
+            try:
+                os.remove(os.path.join(DATA_DIR, rel))
+            except Exception:
+                pass
+            del entries[rel]
+        if drop:
+            save_manifest()
+
+    # leftovers from an interrupted download
+    for fn in os.listdir(CACHE_DIR):
+        if fn.endswith(".tmp"):
+            try:
+                os.remove(os.path.join(CACHE_DIR, fn))
+            except Exception:
+                pass
+    return len(drop)
+
 # ============================================================
 # API
 # ============================================================
@@ -95,10 +283,12 @@ def api_get(path: str, params=None):
     r.raise_for_status()
     return r.json()
 
-def fetch_top_overall(top_n=TOP_N, progress_cb=None):
+def fetch_top_overall(top_n=TOP_N, progress_cb=None, job=None):
     out = []
     offset = 0
     while len(out) < top_n:
+        if job:
+            job.check()
         batch = api_get("/mode/overall", params={"count": PAGE_SIZE, "from": offset})
         if not isinstance(batch, list) or not batch:
             break
@@ -113,6 +303,143 @@ def fetch_top_overall(top_n=TOP_N, progress_cb=None):
 def fetch_player(name: str):
     return api_get(f"/profile/by-name/{name}")
 
+profile_cache = {}
+
+def get_profile(name: str):
+    key = name.lower()
+    hit = profile_cache.get(key)
+    if hit and time.time() - hit[0] < PROFILE_TTL:
+        return hit[1]
+    prof = fetch_player(name)
+    profile_cache[key] = (time.time(), prof)
+    return prof
+
+# ============================================================
+# TASKS
+# ============================================================
+
+class Cancelled(Exception):
+    pass
+
+class Deferred(Exception):
+    """raised by a job to give its worker back and re-queue itself after delay seconds"""
+    def __init__(self, delay):
+        super().__init__(delay)
+        self.delay = delay
+
+class Job:
+    def __init__(self, key, fn, priority):
+        self.key = key
+        self.fn = fn
+        self.priority = priority
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check(self):
+        """raise Cancelled if superseded - call between network steps"""
+        if self._cancel.is_set():
+            raise Cancelled(str(self.key))
+
+class TaskExecutor:
+    """one capped worker pool for all network + image work"""
+    def __init__(self, workers=MAX_WORKERS):
+        self._q = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._jobs = {}  # key -> queued or running Job
+        self._interactive = 0
+        self._idle = threading.Event()
+        self._idle.set()
+        for i in range(workers):
+            threading.Thread(target=self._worker, name=f"task-{i}", daemon=True).start()
+
+    def submit(self, key, fn, priority=PRIO_INTERACTIVE, supersede=False):
+        """
+        fn(job) runs on a worker. Same key already queued/running:
+        returned as-is (dedup), or cancelled and replaced if supersede.
+        """
+        with self._lock:
+            old = self._jobs.get(key)
+            if old and not old.cancelled:
+                if not supersede:
+                    return old
+                old.cancel()
+            job = Job(key, fn, priority)
+            self._jobs[key] = job
+            if priority <= PRIO_INTERACTIVE:
+                self._interactive += 1
+                self._idle.clear()
+            self._q.put((priority, next(self._seq), job))
+            return job
+
+    def cancel(self, kind, keep=None):
+        """cancel every job whose key starts with kind, except keep"""
+        with self._lock:
+            for key, job in self._jobs.items():
+                if key[0] == kind and key != keep:
+                    job.cancel()
+
+    def _requeue(self, job):
+        self._q.put((job.priority, next(self._seq), job))
+
+    def _worker(self):
+        while True:
+            _, _, job = self._q.get()
+            try:
+                if not job.cancelled:
+                    job.fn(job)
+            except Deferred as d:
+                # job stays registered (still dedups), its worker is free meanwhile
+                t = threading.Timer(d.delay, self._requeue, (job,))
+                t.daemon = True
+                t.start()
+                continue
+            except Cancelled:
+                pass
+            except Exception as e:
+                print(f"TASK {job.key} failed: {e}")
+
+            with self._lock:
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                if job.priority <= PRIO_INTERACTIVE:
+                    self._interactive -= 1
+                    if not self._interactive:
+                        self._idle.set()
+
+    def ensure_idle(self, job, retry=0.5):
+        """background jobs: defer while any interactive job is queued or running"""
+        job.check()
+        if not self._idle.is_set():
+            raise Deferred(retry)
+
+class RequestBudget:
+    """sliding-window cap on background requests"""
+    def __init__(self, per_minute):
+        self.per_minute = per_minute
+        self._stamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """take one request, or raise Deferred until the window has room"""
+        with self._lock:
+            now = time.time()
+            while self._stamps and now - self._stamps[0] > 60:
+                self._stamps.popleft()
+            if len(self._stamps) < self.per_minute:
+                self._stamps.append(now)
+                return
+            raise Deferred(60 - (now - self._stamps[0]))
+
+EXECUTOR = TaskExecutor()
+BUDGET = RequestBudget(PREFETCH_BUDGET)
+
 # ============================================================
 # RANK
 # ============================================================
@@ -192,6 +519,7 @@ def fallback_icon(png_path: str, mode: str):
 
 def ensure_icons_safely():
     warnings = []
+    stats = {"downloads": 0, "conversions": 0, "fallbacks": 0}
     for mode in ICON_MODES:
         svg_path = os.path.join(ICON_DIR, f"{mode}.svg")
         png_path = os.path.join(ICON_DIR, f"{mode}.png")
@@ -208,19 +536,25 @@ def ensure_icons_safely():
 
         try:
             svg_bytes = download_svg(mode)
+            stats["downloads"] += 1
             with open(svg_path, "wb") as f:
                 f.write(svg_bytes)
 
             svg_to_png(svg_path, png_path)
+            stats["conversions"] += 1
             img = Image.open(png_path).convert("RGBA")
             if img.getbbox() is None:
                 raise RuntimeError("blank png")
+            record_entry(svg_path)
+            record_entry(png_path)
 
         except Exception as e:
             warnings.append(f"{mode}: {e}")
             fallback_icon(png_path, mode)
+            record_entry(png_path, source="fallback")
+            stats["fallbacks"] += 1
 
-    return "\n".join(warnings)
+    return "\n".join(warnings), stats
 
 def make_circle_chip(icon: Image.Image, size=44):
     base = Image.new("RGBA", (size, size), (0, 0, 0, 0))
@@ -313,10 +647,56 @@ def get_cached_image(url: str, key: str):
             pass
     r = SESSION.get(url, timeout=20)
     r.raise_for_status()
-    with open(p, "wb") as f:
+    # prefetch and lookup can race on the same head: never expose a half-written file
+    tmp = f"{p}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
         f.write(r.content)
+    os.replace(tmp, p)
+    record_entry(p)
     return Image.open(p).convert("RGBA")
 
+# ============================================================
+# PREFETCH
+# ============================================================
+
+def nearby_names(rank: int, leaderboard: list[dict], n=PREFETCH_NEARBY):
+    """players around rank, closest first"""
+    i = rank - 1
+    out = []
+    for d in range(n):
+        for j in (i - 1 - d, i + d):
+            if 0 <= j < len(leaderboard) and leaderboard[j].get("name"):
+                out.append(leaderboard[j]["name"])
+    return out
+
+def prefetch_players(names, tag):
+    """warm profile + head caches at idle priority so lookups open instantly"""
+    todo = deque(names)
+
+    def run(job):
+        # re-entered after every Deferred; finished names are popped so it resumes
+        while todo:
+            name = todo[0]
+            try:
+                EXECUTOR.ensure_idle(job)
+                hit = profile_cache.get(name.lower())
+                if not hit or time.time() - hit[0] >= PROFILE_TTL:
+                    BUDGET.acquire()
+                prof = get_profile(name)
+
+                pname = prof.get("name", name)
+                if not os.path.exists(os.path.join(CACHE_DIR, f"skin_{pname}.png")):
+                    EXECUTOR.ensure_idle(job)
+                    BUDGET.acquire()
+                    get_cached_image(skin_head_url(pname, 96), f"skin_{pname}.png")
+            except (Cancelled, Deferred):
+                raise
+            except Exception as e:
+                print(f"PREFETCH {name}: {e}")
+            todo.popleft()
+
+    EXECUTOR.submit(("prefetch", tag), run, priority=PRIO_IDLE, supersede=True)
+
 # ============================================================
 # UI Widgets
 # ============================================================
@@ -451,7 +831,7 @@ def set_status(msg, ok=True):
     root.update_idletasks()
 
 def refresh_top10k():
-    def run():
+    def run(job):
         global leaderboard, leaderboard_loaded
         try:
             prog_lbl.config(text="Loading...", fg=MUTED)
@@ -460,21 +840,26 @@ def refresh_top10k():
             def progress(n):
                 prog_lbl.config(text=f"Loaded {n}/{TOP_N}")
 
-            lb = fetch_top_overall(TOP_N, progress_cb=progress)
+            lb = fetch_top_overall(TOP_N, progress_cb=progress, job=job)
             if not lb:
                 raise RuntimeError("No leaderboard data returned.")
+            job.check()
             leaderboard = lb
             leaderboard_loaded = True
 
             top1 = lb[0]
             prog_lbl.config(text="")
             set_status(f"Loaded {len(lb)} • #1 {top1.get('name')} ({top1.get('points')} pts)", True)
+        except Cancelled:
+            raise
         except Exception as e:
             leaderboard_loaded = False
             prog_lbl.config(text="")
             set_status("Leaderboard refresh failed", False)
             messagebox.showerror("Error", str(e))
-    threading.Thread(target=run, daemon=True).start()
+
+    # clicking again restarts the download instead of racing it
+    EXECUTOR.submit(("refresh",), run, priority=PRIO_REFRESH, supersede=True)
 
 def live_score_update(*_):
     tiers = {gm: tier_vars[gm].get() for gm in GAMEMODES}
@@ -493,6 +878,8 @@ def calc_rank():
         rank = compute_rank(score, leaderboard)
         cutoff = int(leaderboard[-1].get("points", 0))
 
+        prefetch_players(nearby_names(rank, leaderboard), "rank")
+
         trophy_icon.config(image=chip_photos["overall"])
         trophy_icon.image = chip_photos["overall"]
 
@@ -516,10 +903,11 @@ def lookup_player():
         messagebox.showerror("Error", "Enter a username.")
         return
 
-    def run():
+    def run(job):
         try:
             set_status(f"Looking up {name}...", True)
-            prof = fetch_player(name)
+            prof = get_profile(name)
+            job.check()
 
             pname = prof.get("name", name)
             points = prof.get("points")
@@ -528,6 +916,7 @@ def lookup_player():
 
             head = get_cached_image(skin_head_url(pname, 96), f"skin_{pname}.png")
             head = head.resize((76, 76), Image.LANCZOS)
+            job.check()
             ph = ImageTk.PhotoImage(head)
             skin_lbl.config(image=ph)
             skin_lbl.image = ph
@@ -553,7 +942,7 @@ def lookup_player():
                     cell = tk.Frame(tiers_row.inner, bg=CARD)
                     cell.pack(side="left", padx=10, pady=10)
 
-                    tk.Label(cell, image=chip_photos[gm], bg=CARD).pack()
+                    tk.Label(cell, image=chip_photos.get(gm), bg=CARD).pack()
 
                     key = (tier_str, retired)
                     if key not in badge_cache:
@@ -561,18 +950,63 @@ def lookup_player():
                     tk.Label(cell, image=badge_cache[key], bg=CARD).pack(pady=(8, 0))
 
             set_status("Lookup complete ✅", True)
+        except Cancelled:
+            raise
         except Exception as e:
             set_status("Lookup failed", False)
             messagebox.showerror("Lookup Error", str(e))
 
-    threading.Thread(target=run, daemon=True).start()
+    # newest lookup wins, repeated lookups of the same name collapse
+    key = ("lookup", name.lower())
+    EXECUTOR.cancel("lookup", keep=key)
+    EXECUTOR.submit(key, run, priority=PRIO_INTERACTIVE)
+
+prefetch_after = None
+
+def prefetch_matches(*_):
+    # debounce typing, then warm the top leaderboard names matching the prefix
+    global prefetch_after
+    if prefetch_after:
+        root.after_cancel(prefetch_after)
+        prefetch_after = None
+    prefix = lookup_var.get().strip().lower()
+    if len(prefix) < 3 or not leaderboard_loaded:
+        return
+
+    def go():
+        global prefetch_after
+        prefetch_after = None
+        names = [p["name"] for p in leaderboard
+                 if str(p.get("name", "")).lower().startswith(prefix)][:PREFETCH_MATCHES]
+        if names:
+            prefetch_players(names, "matches")
+
+    prefetch_after = root.after(400, go)
 
 def startup():
     set_status("Loading icons...", True)
-    warn = ensure_icons_safely()
-    if warn:
-        print("ICON WARNINGS:\n" + warn)
 
+    def run(job):
+        t0 = time.perf_counter()
+        seeded = seed_data_dir()
+        prune_cache()
+        t1 = time.perf_counter()
+        warn, st = ensure_icons_safely()
+        t2 = time.perf_counter()
+        if warn:
+            print("ICON WARNINGS:\n" + warn)
+
+        # cold = anything had to be copied, downloaded or converted this run
+        start = "cold" if seeded or st["downloads"] or st["conversions"] or st["fallbacks"] else "warm"
+        before = f"{LAUNCH_ELAPSED:.2f}s" if LAUNCH_ELAPSED is not None else "n/a"
+        print(f"STARTUP {start}: launch->main.py {before}, seed {t1 - t0:.2f}s ({seeded} copied), "
+              f"icons {t2 - t1:.2f}s ({st['downloads']} downloaded, {st['conversions']} converted, "
+              f"{st['fallbacks']} fallback), ready at {time.perf_counter() - START_T:.2f}s ({DATA_DIR})")
+        root.after(0, icons_ready)
+
+    EXECUTOR.submit(("icons",), run, priority=PRIO_INTERACTIVE)
+
+def icons_ready():
     for mode in ICON_MODES:
         try:
             chip_photos[mode] = load_chip_photo(mode, chip_size=46 if mode == "overall" else 44)
@@ -684,6 +1118,7 @@ lookup_row = tk.Frame(right_frame, bg=CARD)
 lookup_row.pack(fill="x", padx=18, pady=(0, 14))
 
 lookup_var = tk.StringVar(value="")
+lookup_var.trace_add("write", prefetch_matches)
 
 entry_box = tk.Frame(lookup_row, bg="#0a0f16", highlightthickness=2, highlightbackground=BORDER)
 entry_box.pack(side="left", fill="x", expand=True, padx=(0, 10))